@@ -1,9 +1,13 @@
 import random
 import statistics
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-from treys import Deck, Card, Evaluator
+from treys import Deck, Card
 from .bot import bot_decision_wrapper
-from .models import BOT_LOG_TEMPLATE
+from .hand_eval import evaluate_hands
+from .models import new_bot_log
 from .constants import (
     STARTING_MONEY,
     DEFAULT_RAISE_AMOUNT,
@@ -23,6 +27,7 @@ from .constants import (
     COLOR_DARK as DARK,
     COLOR_PANEL as PANEL,
     COLOR_ACCENT as ACCENT,
+    LOG_VERBOSE as VERBOSE,
 )
 
 
@@ -30,7 +35,7 @@ from .constants import (
 # Pygame INIT
 # =========================
 pygame.init()
-SCREEN = pygame.display.set_mode((W, H))
+SCREEN = pygame.display.set_mode((W, H), pygame.DOUBLEBUF)
 pygame.display.set_caption("Texas Hold'em — You vs Bot (Deluxe)")
 CLOCK = pygame.time.Clock()
 
@@ -81,6 +86,12 @@ FONT_BIG  = pygame.font.SysFont("consolas", 28, bold=True)
 FONT      = pygame.font.SysFont("consolas", 22)
 FONT_SM   = pygame.font.SysFont("consolas", 18)
 
+
+@lru_cache(maxsize=512)
+def render_text(text, font, color):
+    """Render text once per (text, font, color); repeated labels like "$0" hit the cache."""
+    return font.render(text, True, color)
+
 # =========================
 # Poker helpers
 # =========================
@@ -92,9 +103,8 @@ def compare_hands(cards1, cards2, community):
        -1  nếu cards2 thắng
         0  hòa
     """
-    evaluator = Evaluator()
-    rank1 = evaluator.evaluate(community, cards1)
-    rank2 = evaluator.evaluate(community, cards2)
+    # bàn chung chỉ được tính một lần cho cả hai người chơi
+    rank1, rank2 = evaluate_hands(community, cards1, cards2)
     if rank1 < rank2:
         return 1
     elif rank1 > rank2:
@@ -103,6 +113,9 @@ def compare_hands(cards1, cards2, community):
 
 
 class Player:
+    # depth / mc_sims / bot_log are only set on the bot
+    __slots__ = ("name", "is_bot", "money", "hand", "folded", "current_bet", "depth", "mc_sims", "bot_log")
+
     def __init__(self, name, is_bot=False):
         self.name = name
         self.is_bot = is_bot
@@ -113,7 +126,7 @@ class Player:
         if is_bot:
             self.depth = DEFAULT_BOT_DEPTH
             self.mc_sims = DEFAULT_BOT_MC_SIMS
-            self.bot_log = BOT_LOG_TEMPLATE.copy()
+            self.bot_log = new_bot_log()
 
     def reset(self):
         self.hand = []
@@ -134,22 +147,40 @@ class Player:
 class Button:
     def __init__(self, rect, text, bg=GRAY, fg=WHITE, font=FONT):
         self.rect = pygame.Rect(rect)
-        self.text = text
         self.bg = bg
         self.fg = fg
         self.font = font
         self.disabled = False
-
-    def draw(self, surf):
-        color = (90, 90, 90) if self.disabled else self.bg
-        pygame.draw.rect(surf, color, self.rect, border_radius=10)
-        pygame.draw.rect(surf, BLACK, self.rect, 2, border_radius=10)
+        self.text = text
+        # (text, disabled) -> pre-rendered surface; labels like "Check"/"Call"
+        # flip back and forth, so every variant is rendered only once
+        self._surfs = {}
+
+    def _render(self, disabled):
+        # Pre-render background + border + label once, blit it every frame
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local = surf.get_rect()
+        color = (90, 90, 90) if disabled else self.bg
+        pygame.draw.rect(surf, color, local, border_radius=10)
+        pygame.draw.rect(surf, BLACK, local, 2, border_radius=10)
         ts = self.font.render(
             self.text,
             True,
-            (200, 200, 200) if self.disabled else self.fg,
+            (200, 200, 200) if disabled else self.fg,
         )
-        surf.blit(ts, ts.get_rect(center=self.rect.center))
+        surf.blit(ts, ts.get_rect(center=local.center))
+        return surf
+
+    @property
+    def surface(self):
+        key = (self.text, self.disabled)
+        surf = self._surfs.get(key)
+        if surf is None:
+            surf = self._surfs[key] = self._render(self.disabled)
+        return surf
+
+    def draw(self, surf):
+        surf.blit(self.surface, self.rect)
 
     def handle(self, ev):
         return (
@@ -177,7 +208,7 @@ def draw_card(cint, x, y, w=64, h=92, face_up=True, scale=1.0):
 
     if face_up and cint:
         label, col = card_label(cint)
-        txt = FONT_BIG.render(label, True, col)
+        txt = render_text(label, FONT_BIG, col)
         SCREEN.blit(txt, (x + 8, y + 6))
     elif not face_up:
         for i in range(4):
@@ -206,15 +237,35 @@ class PokerGame:
         self.current_bet = 0
         self.dealer_index = 0  # 0: You, 1: Bot
         self.active_player_index = 0
+        self._active_count = len(self.players)  # số player chưa fold
+
+        # Round tallies as flat ints (no nested stats dict)
+        self.round_wins = [0] * len(self.players)  # theo index player
+        self.round_ties = 0
 
         # UI state
-        self.logs = []         # [(text, color), ...]
+        self.logs = deque(maxlen=200)  # [(text, color), ...], giữ 200 dòng mới nhất
         self.raise_amount = 5
         self.log_scroll = 0          # pixel offset
         self.log_line_height = 20    # mỗi dòng log cao 20px
         self.last_action = ""
         self.particles = []          # particle effect khi thắng pot
         self.reveal_scale = 1.0      # scale lật bài bot khi showdown
+        self.log_seq = 0             # số log đã ghi (deque tự bỏ dòng cũ)
+
+        # Repaint tracking: draw() skips frames whose visible state is unchanged
+        self._dirty = True
+        self._last_view = None
+
+        # Bot decisions run on a worker thread so the UI keeps pumping events
+        self._pool = ThreadPoolExecutor(max_workers=1)
+
+        # Only queue the events the UI actually reacts to
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+            pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.WINDOWEXPOSED,
+        ])
 
         # ========== MAIN MENU STATE ==========
         self.last_round_result = "No rounds played yet."
@@ -241,6 +292,33 @@ class PokerGame:
             "level_plus":  Button((710, 370, 60, 50), "+", bg=GRAY),
         }
 
+        # Labels that never change, rendered once
+        self._static_surfs = {
+            "title": FONT_HUGE.render("Texas Hold'em — You vs Bot", True, ACCENT),
+            "community_lbl": FONT_BIG.render("Community", True, WHITE),
+            "you_lbl": FONT_BIG.render("You", True, WHITE),
+            "bot_lbl": FONT_BIG.render("Bot", True, WHITE),
+            "folded": FONT_BIG.render("FOLDED", True, RED),
+            "menu_title": FONT_HUGE.render("Texas Hold'em", True, ACCENT),
+            "menu_sub": FONT_BIG.render("Main Menu", True, WHITE),
+            "menu_last": FONT_BIG.render("Last Round:", True, WHITE),
+            "menu_strength": FONT_BIG.render("Bot Strength", True, WHITE),
+            "menu_level": FONT.render("Bot Level:", True, ACCENT),
+            "menu_tip": FONT_SM.render("Tip: level 1-10 (depth 1-10, mc sims 50-5000)", True, (180, 180, 180)),
+        }
+
+        # Table geometry + colours used by draw(), built once instead of every frame
+        self._table_rect = pygame.Rect(20, 20, W - 40, 640)
+        self._hud_rect = pygame.Rect(0, 700, W, 100)
+        self._you_panel_rect = pygame.Rect(20, 240, W - 600, 170)
+        self._bot_panel_rect = pygame.Rect(20, 430, W - 600, 170)
+        self._log_rect = pygame.Rect(760, 240, 400, 360)
+        self._panel_color = (40, 40, 46)
+        self._buttons_tuple = tuple(self.buttons.values())
+
+        # key -> (value, surface) for HUD labels like "Pot: $12"
+        self._hud_labels = {}
+
         self.apply_bot_settings()
 
     # ===== Apply bot settings from menu =====
@@ -253,7 +331,12 @@ class PokerGame:
 
     # ---- dealing
     def create_deck(self):
-        self.deck = Deck()
+        # Deck() seeds a fresh Random each time; one deck per game is enough,
+        # shuffle() refills all 52 cards with its existing generator
+        if self.deck is None:
+            self.deck = Deck()
+        else:
+            self.deck.shuffle()
         safe_play(SND_SHUFFLE)
 
     def deal_hole_cards(self):
@@ -261,20 +344,22 @@ class PokerGame:
             p.hand = self.deck.draw(2)
 
     def burn_card(self):
-        if self.deck:
-            self.deck.draw(1)
+        # treys draws from the end of deck.cards; pop directly instead of
+        # building a throwaway one-card list
+        if self.deck and self.deck.cards:
+            self.deck.cards.pop()
 
     def deal_flop(self):
         self.burn_card()
-        self.community += self.deck.draw(3)
+        self.community.extend(self.deck.draw(3))
 
     def deal_turn(self):
         self.burn_card()
-        self.community += self.deck.draw(1)
+        self.community.extend(self.deck.draw(1))
 
     def deal_river(self):
         self.burn_card()
-        self.community += self.deck.draw(1)
+        self.community.extend(self.deck.draw(1))
 
     # ---- utils
     def log(self, s, type="info"):
@@ -286,12 +371,13 @@ class PokerGame:
         }
         col = color_map.get(type, (220, 220, 220))
         self.logs.append((s, col))
-        if len(self.logs) > 200:
-            self.logs = self.logs[-200:]
-        print(s)
+        self.log_seq += 1
+        if VERBOSE:
+            print(s)
 
     def isEnded(self):
-        return len([p for p in self.players if not p.folded]) <= 1
+        # O(1): _active_count is kept in sync with folds by reset() and _act()
+        return self._active_count <= 1
 
     def handle_log_scroll(self, ev):
         if ev.type == pygame.MOUSEWHEEL:
@@ -302,6 +388,22 @@ class PokerGame:
             elif ev.key == pygame.K_DOWN:
                 self.log_scroll -= 20
 
+    def read_events(self, wait=False):
+        """Drain the event queue, first blocking up to one frame if wait is set.
+
+        Every UI loop reads events through here so an uncovered window
+        (WINDOWEXPOSED) always marks the screen for a full repaint.
+        """
+        events = pygame.event.get()
+        if wait and not events:
+            ev = pygame.event.wait(1000 // FPS)
+            events = pygame.event.get()
+            if ev.type != pygame.NOEVENT:
+                events.insert(0, ev)
+        if any(ev.type == pygame.WINDOWEXPOSED for ev in events):
+            self._dirty = True
+        return events
+
     def spawn_win_particles(self, winner_index: int):
         base_x, base_y = 80, 150
         if winner_index == 0:
@@ -337,79 +439,108 @@ class PokerGame:
     # MAIN MENU DRAW
     # =========================
     def draw_menu(self):
+        # the table has to be fully repainted after the menu covered it
+        self._dirty = False
+        self._last_view = None
         SCREEN.fill(DARK)
 
         pygame.draw.rect(SCREEN, PANEL, (180, 120, 840, 560), border_radius=22)
         pygame.draw.rect(SCREEN, (80, 80, 90), (180, 120, 840, 560), 2, border_radius=22)
 
-        SCREEN.blit(FONT_HUGE.render("Texas Hold'em", True, ACCENT), (220, 150))
-        SCREEN.blit(FONT_BIG.render("Main Menu", True, WHITE), (220, 205))
+        SCREEN.blit(self._static_surfs["menu_title"], (220, 150))
+        SCREEN.blit(self._static_surfs["menu_sub"], (220, 205))
 
         # Last result
-        SCREEN.blit(FONT_BIG.render("Last Round:", True, WHITE), (220, 260))
+        SCREEN.blit(self._static_surfs["menu_last"], (220, 260))
         msg = self.last_round_result
 
         # simple wrap (2 lines)
         line1 = msg[:56]
         line2 = msg[56:112] if len(msg) > 56 else ""
-        SCREEN.blit(FONT.render(line1, True, (220, 220, 220)), (220, 295))
+        SCREEN.blit(render_text(line1, FONT, (220, 220, 220)), (220, 295))
         if line2:
-            SCREEN.blit(FONT.render(line2, True, (220, 220, 220)), (220, 322))
+            SCREEN.blit(render_text(line2, FONT, (220, 220, 220)), (220, 322))
 
         # Bot strength title
-        SCREEN.blit(FONT_BIG.render("Bot Strength", True, WHITE), (220, 350))
+        SCREEN.blit(self._static_surfs["menu_strength"], (220, 350))
 
         # Level
-        SCREEN.blit(FONT.render("Bot Level:", True, ACCENT), (220, 380))
+        SCREEN.blit(self._static_surfs["menu_level"], (220, 380))
         pygame.draw.rect(SCREEN, (20, 20, 22), (500, 370, 200, 50), border_radius=12)
         pygame.draw.rect(SCREEN, (90, 90, 100), (500, 370, 200, 50), 2, border_radius=12)
-        SCREEN.blit(FONT_BIG.render(str(int(self.menu_level)), True, WHITE), (590, 380))
+        SCREEN.blit(render_text(str(int(self.menu_level)), FONT_BIG, WHITE), (590, 380))
 
         # hints
-        SCREEN.blit(FONT_SM.render("Tip: level 1-10 (depth 1-10, mc sims 50-5000)", True, (180, 180, 180)), (220, 470))
+        SCREEN.blit(self._static_surfs["menu_tip"], (220, 470))
 
         for b in self.menu_buttons.values():
             b.draw(SCREEN)
 
         pygame.display.flip()
-        CLOCK.tick(FPS)
 
     # ---- draw table
+    def _hud_label(self, key, template, value, color):
+        """Surface for a HUD label; formatted and rendered only when its value changes."""
+        cached = self._hud_labels.get(key)
+        if cached is None or cached[0] != value:
+            cached = self._hud_labels[key] = (value, render_text(template.format(value), FONT, color))
+        return cached[1]
+
+    def _view_state(self, headline, reveal_bot):
+        """Snapshot of everything the table shows, used to detect unchanged frames."""
+        you, bot = self.players
+        return (
+            headline, reveal_bot, self.reveal_scale,
+            self.pot, self.current_bet, self.dealer_index, self.active_player_index,
+            self.last_action, self.raise_amount, self.log_scroll, self.log_seq,
+            tuple(self.community),
+            you.money, you.current_bet, you.folded, tuple(you.hand),
+            bot.money, bot.current_bet, bot.folded, tuple(bot.hand),
+            tuple((b.text, b.disabled) for b in self._buttons_tuple),
+        )
+
     def draw(self, headline="TABLE", reveal_bot=False):
+        # Skip the repaint + flip when nothing visible changed (particles always animate)
+        view = self._view_state(headline, reveal_bot)
+        if not self._dirty and not self.particles and view == self._last_view:
+            return
+        self._last_view = view
+        self._dirty = False
+
         SCREEN.fill(DARK)
 
-        pygame.draw.rect(SCREEN, GREEN, (20, 20, W - 40, 640), border_radius=18)
-        pygame.draw.rect(SCREEN, PANEL, (0, 700, W, 100))
+        pygame.draw.rect(SCREEN, GREEN, self._table_rect, border_radius=18)
+        pygame.draw.rect(SCREEN, PANEL, self._hud_rect)
 
-        SCREEN.blit(FONT_HUGE.render("Texas Hold'em — You vs Bot", True, ACCENT), (30, 26))
-        SCREEN.blit(FONT_BIG.render(headline, True, WHITE), (30, 70))
+        SCREEN.blit(self._static_surfs["title"], (30, 26))
+        SCREEN.blit(render_text(headline, FONT_BIG, WHITE), (30, 70))
 
         SCREEN.blit(
-            FONT.render(f"Dealer: {self.players[self.dealer_index].name}", True, WHITE),
+            self._hud_label("dealer", "Dealer: {}", self.players[self.dealer_index].name, WHITE),
             (30, 110),
         )
 
         if CHIP_IMG:
             SCREEN.blit(CHIP_IMG, (30, 140))
-            SCREEN.blit(FONT.render(f"${self.pot}", True, YELLOW), (90, 150))
+            SCREEN.blit(self._hud_label("pot_chip", "${}", self.pot, YELLOW), (90, 150))
         else:
-            SCREEN.blit(FONT.render(f"Pot: ${self.pot}", True, YELLOW), (30, 140))
+            SCREEN.blit(self._hud_label("pot", "Pot: ${}", self.pot, YELLOW), (30, 140))
 
-        SCREEN.blit(FONT.render(f"Current Bet: ${self.current_bet}", True, WHITE), (30, 180))
+        SCREEN.blit(self._hud_label("current_bet", "Current Bet: ${}", self.current_bet, WHITE), (30, 180))
 
         if self.last_action:
-            SCREEN.blit(FONT.render(f"Last action: {self.last_action}", True, ACCENT), (620, 50))
+            SCREEN.blit(self._hud_label("last_action", "Last action: {}", self.last_action, ACCENT), (620, 50))
 
-        SCREEN.blit(FONT_BIG.render("Community", True, WHITE), (620, 80))
+        SCREEN.blit(self._static_surfs["community_lbl"], (620, 80))
         draw_row(self.community, 620, 120, True)
 
         # Player
-        you_rect = pygame.Rect(20, 240, W - 600, 170)
-        pygame.draw.rect(SCREEN, (40, 40, 46), you_rect, border_radius=20)
+        you_rect = self._you_panel_rect
+        pygame.draw.rect(SCREEN, self._panel_color, you_rect, border_radius=20)
         you = self.players[0]
-        SCREEN.blit(FONT_BIG.render("You", True, WHITE), (40, 250))
-        SCREEN.blit(FONT.render(f"Money: ${you.money}", True, YELLOW), (40, 284))
-        SCREEN.blit(FONT.render(f"Your Bet: ${you.current_bet}", True, WHITE), (40, 314))
+        SCREEN.blit(self._static_surfs["you_lbl"], (40, 250))
+        SCREEN.blit(self._hud_label("you_money", "Money: ${}", you.money, YELLOW), (40, 284))
+        SCREEN.blit(self._hud_label("you_bet", "Your Bet: ${}", you.current_bet, WHITE), (40, 314))
 
         if AVATAR_YOU:
             SCREEN.blit(AVATAR_YOU, (220, 250))
@@ -417,15 +548,15 @@ class PokerGame:
         draw_row(you.hand, 320, 260, True)
 
         if you.folded:
-            SCREEN.blit(FONT_BIG.render("FOLDED", True, RED), (320, 320))
+            SCREEN.blit(self._static_surfs["folded"], (320, 320))
 
         # Bot
-        bot_rect = pygame.Rect(20, 430, W - 600, 170)
-        pygame.draw.rect(SCREEN, (40, 40, 46), bot_rect, border_radius=20)
+        bot_rect = self._bot_panel_rect
+        pygame.draw.rect(SCREEN, self._panel_color, bot_rect, border_radius=20)
         bot = self.players[1]
-        SCREEN.blit(FONT_BIG.render("Bot", True, WHITE), (40, 440))
-        SCREEN.blit(FONT.render(f"Money: ${bot.money}", True, YELLOW), (40, 474))
-        SCREEN.blit(FONT.render(f"Bot Bet: ${bot.current_bet}", True, WHITE), (40, 504))
+        SCREEN.blit(self._static_surfs["bot_lbl"], (40, 440))
+        SCREEN.blit(self._hud_label("bot_money", "Money: ${}", bot.money, YELLOW), (40, 474))
+        SCREEN.blit(self._hud_label("bot_bet", "Bot Bet: ${}", bot.current_bet, WHITE), (40, 504))
 
         if AVATAR_BOT:
             SCREEN.blit(AVATAR_BOT, (220, 450))
@@ -437,7 +568,7 @@ class PokerGame:
                 draw_card(0, 320 + i * 72, 450, face_up=False)
 
         if bot.folded:
-            SCREEN.blit(FONT_BIG.render("FOLDED", True, RED), (320, 510))
+            SCREEN.blit(self._static_surfs["folded"], (320, 510))
 
         # Highlight turn
         if self.active_player_index == 0:
@@ -446,37 +577,41 @@ class PokerGame:
             pygame.draw.rect(SCREEN, (220, 120, 120), bot_rect, 3, border_radius=20)
 
         # Raise amount
-        SCREEN.blit(FONT.render(f"Raise Amount: ${self.raise_amount}", True, ACCENT), (500, 680))
+        SCREEN.blit(self._hud_label("raise_amount", "Raise Amount: ${}", self.raise_amount, ACCENT), (500, 680))
 
         # LOG WINDOW (scrollable)
-        LOG_X, LOG_Y, LOG_W, LOG_H = 760, 240, 400, 360
+        log_rect = self._log_rect
+        LOG_X, LOG_Y, LOG_W, LOG_H = log_rect
 
-        pygame.draw.rect(SCREEN, (10, 10, 10), pygame.Rect(LOG_X, LOG_Y, LOG_W, LOG_H), border_radius=10)
-        pygame.draw.rect(SCREEN, (200, 200, 200), pygame.Rect(LOG_X, LOG_Y, LOG_W, LOG_H), 2, border_radius=10)
+        pygame.draw.rect(SCREEN, (10, 10, 10), log_rect, border_radius=10)
+        pygame.draw.rect(SCREEN, (200, 200, 200), log_rect, 2, border_radius=10)
 
-        content_h = max(LOG_H, len(self.logs) * self.log_line_height)
-        log_surface = pygame.Surface((LOG_W - 20, content_h), pygame.SRCALPHA)
-        log_surface.fill((0, 0, 0, 0))
+        # skip the surface + scroll work while the log is empty (start of a round)
+        if self.logs:
+            content_h = max(LOG_H, len(self.logs) * self.log_line_height)
+            log_surface = pygame.Surface((LOG_W - 20, content_h), pygame.SRCALPHA)
+            log_surface.fill((0, 0, 0, 0))
 
-        for i, (line, col) in enumerate(self.logs):
-            text = FONT_SM.render(line, True, col)
-            log_surface.blit(text, (0, i * self.log_line_height))
+            for i, (line, col) in enumerate(self.logs):
+                text = render_text(line, FONT_SM, col)
+                log_surface.blit(text, (0, i * self.log_line_height))
 
-        max_scroll = max(0, content_h - LOG_H + 20)
-        self.log_scroll = max(-max_scroll, min(0, self.log_scroll))
+            max_scroll = max(0, content_h - LOG_H + 20)
+            self.log_scroll = max(-max_scroll, min(0, self.log_scroll))
 
-        clip_rect = pygame.Rect(LOG_X, LOG_Y, LOG_W, LOG_H)
-        SCREEN.set_clip(clip_rect)
-        SCREEN.blit(log_surface, (LOG_X + 10, LOG_Y + self.log_scroll))
-        SCREEN.set_clip(None)
+            SCREEN.set_clip(log_rect)
+            SCREEN.blit(log_surface, (LOG_X + 10, LOG_Y + self.log_scroll))
+            SCREEN.set_clip(None)
+        else:
+            self.log_scroll = 0
 
         self.update_and_draw_particles()
 
-        for b in self.buttons.values():
-            b.draw(SCREEN)
+        # one batched blit for all table buttons
+        SCREEN.blits([(b.surface, b.rect.topleft) for b in self._buttons_tuple], doreturn=False)
 
+        # frame pacing is done by the calling event loops, not here
         pygame.display.flip()
-        CLOCK.tick(FPS)
 
     # ---- blinds
     def post_blinds(self):
@@ -501,8 +636,15 @@ class PokerGame:
         self.buttons["cc"].text = ("Check" if (can_check or self.current_bet == 0) else "Call")
         self.buttons["raise"].text = ("Bet" if self.current_bet == 0 else "Raise")
 
+        dirty = True
         while True:
-            for ev in pygame.event.get():
+            # only repaint when something visible changed
+            if dirty or self._dirty:
+                self.draw("YOUR TURN")
+            before = (self.raise_amount, self.log_scroll)
+            dirty = False
+
+            for ev in self.read_events(wait=True):
                 self.handle_log_scroll(ev)
                 if ev.type == pygame.QUIT:
                     pygame.quit()
@@ -525,18 +667,29 @@ class PokerGame:
                 elif self.buttons["raise"].handle(ev):
                     return "bet" if self.current_bet == 0 else "raise"
 
-            self.draw("YOUR TURN")
+            if (self.raise_amount, self.log_scroll) != before:
+                dirty = True
+            CLOCK.tick(FPS)
 
     # ---- 1 action của 1 player
     def _act(self, p):
-        self.draw(f"{p.name}'s turn")
+        # no upfront repaint: the bot loop draws "Bot thinking..." and
+        # _wait_player_buttons redraws "YOUR TURN" every frame
         can_check = (p.current_bet == self.current_bet)
 
         # BOT
         if p.is_bot:
-            pygame.time.delay(random.randint(300, 900))
-            pygame.event.pump()
-            action = bot_decision_wrapper(self, p)
+            think_until = pygame.time.get_ticks() + random.randint(300, 900)
+            fut = self._pool.submit(bot_decision_wrapper, self, p)
+            while not fut.done() or pygame.time.get_ticks() < think_until:
+                for ev in self.read_events():
+                    self.handle_log_scroll(ev)
+                    if ev.type == pygame.QUIT:
+                        pygame.quit()
+                        raise SystemExit
+                self.draw("Bot thinking...")
+                CLOCK.tick(FPS)
+            action = fut.result()
 
             if action == "bet" or action == "raise":
                 action = "raise"
@@ -547,6 +700,7 @@ class PokerGame:
 
             if action == "fold":
                 p.folded = True
+                self._active_count -= 1
                 safe_play(SND_FOLD)
                 return "fold"
 
@@ -580,6 +734,7 @@ class PokerGame:
 
             if action == "fold":
                 p.folded = True
+                self._active_count -= 1
                 self.last_action = "You: Fold"
                 self.log("You fold.", type="action")
                 safe_play(SND_FOLD)
@@ -698,7 +853,7 @@ class PokerGame:
 
         waiting = True
         while waiting:
-            for ev in pygame.event.get():
+            for ev in self.read_events():
                 self.handle_log_scroll(ev)
                 if ev.type == pygame.QUIT:
                     pygame.quit()
@@ -713,6 +868,7 @@ class PokerGame:
                     waiting = False
 
             self.draw(f"ROUND OVER — {message}", reveal_bot=True)
+            CLOCK.tick(FPS)
 
     # ---- showdown
     def showdown(self):
@@ -736,10 +892,7 @@ class PokerGame:
             # update last round result for MENU
             self.last_round_result = msg
 
-            if winner.is_bot:
-                BOT_LOG_TEMPLATE["rounds"]["bot_wins"] += 1
-            else:
-                BOT_LOG_TEMPLATE["rounds"]["player_wins"] += 1
+            self.round_wins[winner_index] += 1
 
             self._round_end_pause(msg)
             return
@@ -755,22 +908,25 @@ class PokerGame:
         if res == 1:
             msg = f"You win ${self.pot}!"
             self.players[0].money += self.pot
-            BOT_LOG_TEMPLATE["rounds"]["player_wins"] += 1
             winner_index = 0
         elif res == -1:
             msg = f"Bot wins ${self.pot}!"
             self.players[1].money += self.pot
-            BOT_LOG_TEMPLATE["rounds"]["bot_wins"] += 1
             winner_index = 1
         else:
             msg = "It's a tie! Pot is split."
-            self.players[0].money += self.pot / 2
-            self.players[1].money += self.pot / 2
-            BOT_LOG_TEMPLATE["rounds"]["ties"] += 1
+            # integer split keeps money/pot as ints; the odd chip goes to the
+            # small blind, which rotates with the dealer every hand
+            half, rem = divmod(self.pot, 2)
+            self.players[0].money += half
+            self.players[1].money += half
+            self.players[self.dealer_index % 2].money += rem
+            self.round_ties += 1
 
         self.log(msg, type="win")
         safe_play(SND_WIN)
         if winner_index is not None:
+            self.round_wins[winner_index] += 1
             self.spawn_win_particles(winner_index)
 
         # update last round result for MENU
@@ -784,6 +940,7 @@ class PokerGame:
         self.dealer_index %= len(self.players)
         for p in self.players:
             p.reset()
+        self._active_count = len(self.players)
         self.pot = 0
         self.current_bet = 0
         self.community = []
@@ -796,7 +953,7 @@ class PokerGame:
         self.apply_bot_settings()
 
         self.reset()
-        self.logs = []
+        self.logs.clear()
         self.draw("NEW ROUND")
 
         self.post_blinds()
@@ -837,11 +994,26 @@ class PokerGame:
         self.dealer_index = (self.dealer_index + 1) % 2
 
     def play_game(self):
+        try:
+            self._play_loop()
+        finally:
+            # Every quit path ends here (return or SystemExit): don't let a
+            # bot decision still queued or running outlive the window
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _play_loop(self):
         while True:
             # ===== MAIN MENU LOOP =====
             in_menu = True
+            dirty = True
             while in_menu:
-                for ev in pygame.event.get():
+                # only repaint the menu when something visible changed
+                if dirty or self._dirty:
+                    self.draw_menu()
+                before = self.menu_level
+                dirty = False
+
+                for ev in self.read_events(wait=True):
                     if ev.type == pygame.QUIT:
                         pygame.quit()
                         return
@@ -864,11 +1036,13 @@ class PokerGame:
                         for p in self.players:
                             p.money = 100
                         if self.players[1].is_bot:
-                            self.players[1].bot_log = BOT_LOG_TEMPLATE.copy()
+                            self.players[1].bot_log = new_bot_log()
                         self.apply_bot_settings()
                         in_menu = False
 
-                self.draw_menu()
+                if self.menu_level != before:
+                    dirty = True
+                CLOCK.tick(FPS)
 
             # ===== GAME LOOP =====
             self.in_game = True
@@ -7,14 +7,20 @@ Usage:
 """
 
 import json
+import math
+import multiprocessing
+import os
+import random
 import sys
 import time
-from typing import Dict, Any
-from treys import Deck, Card, Evaluator
+from typing import Dict, Any, Tuple
+from treys import Deck
 
 # Import bot decision logic
 sys.path.insert(0, '.')
 from src.bot import bot_decision
+from src.hand_eval import evaluate_hands
+from src.models import new_bot_log
 
 
 def load_config(config_file: str = "config_autotest.json") -> Dict[str, Any]:
@@ -25,6 +31,8 @@ def load_config(config_file: str = "config_autotest.json") -> Dict[str, Any]:
 
 class Player:
     """Represents a bot player."""
+    __slots__ = ("name", "money", "hand", "folded", "current_bet", "depth", "mc_sims", "bot_log")
+
     def __init__(self, name: str, depth: int = 3, mc_sims: int = 500):
         self.name = name
         self.money = 100
@@ -33,15 +41,7 @@ class Player:
         self.current_bet = 0
         self.depth = depth
         self.mc_sims = mc_sims
-        self.bot_log = {
-            "decisions": 0,
-            "folds": 0,
-            "calls": 0,
-            "raises": 0,
-            "checks": 0,
-            "win_probs": [],
-            "decision_times": []
-        }
+        self.bot_log = new_bot_log()
 
     def reset(self):
         """Reset for new hand."""
@@ -52,21 +52,41 @@ class Player:
 
 class PokerGame:
     """Simple poker game for testing."""
+    __slots__ = (
+        "players", "small_blind", "big_blind", "_deck_buf", "_deck_idx",
+        "community", "pot", "current_bet", "hands_played",
+    )
+
     def __init__(self, player1: Player, player2: Player, small_blind: int = 2, big_blind: int = 5):
         self.players = [player1, player2]
         self.small_blind = small_blind
         self.big_blind = big_blind
-        self.deck = Deck()
+        # One deck buffer reshuffled in place each hand instead of a new Deck()
+        self._deck_buf = Deck.GetFullDeck()
+        self._deck_idx = 0
         self.community = []
         self.pot = 0
         self.current_bet = 0
-        self.evaluator = Evaluator()
+        # Seats never rotate (players[0] is always the small blind), so the
+        # odd chip of a split pot alternates by hand number instead
+        self.hands_played = 0
+
+    def _reset_deck(self):
+        """Shuffle the deck buffer in place and rewind the draw pointer."""
+        random.shuffle(self._deck_buf)
+        self._deck_idx = 0
+
+    def _draw(self, n: int) -> list:
+        """Draw the next n cards from the deck buffer."""
+        out = self._deck_buf[self._deck_idx:self._deck_idx + n]
+        self._deck_idx += n
+        return out
 
     def reset_hand(self):
         """Reset for new hand."""
         for p in self.players:
             p.reset()
-        self.deck = Deck()
+        self._reset_deck()
         self.community = []
         self.pot = 0
         self.current_bet = 0
@@ -74,6 +94,7 @@ class PokerGame:
     def play_hand(self) -> bool:
         """Play one hand. Returns True if game can continue."""
         self.reset_hand()
+        self.hands_played += 1
         
         # Post blinds
         self.players[0].current_bet = self.small_blind
@@ -84,24 +105,24 @@ class PokerGame:
 
         # Deal cards
         for p in self.players:
-            p.hand = self.deck.draw(2)
+            p.hand = self._draw(2)
 
         # Pre-flop
         if not self.betting_round():
             return self.check_bankrupt()
 
         # Flop
-        self.community = self.deck.draw(3)
+        self.community = self._draw(3)
         if not self.betting_round():
             return self.check_bankrupt()
 
         # Turn
-        self.community.append(self.deck.draw(1)[0])
+        self.community.append(self._draw(1)[0])
         if not self.betting_round():
             return self.check_bankrupt()
 
         # River
-        self.community.append(self.deck.draw(1)[0])
+        self.community.append(self._draw(1)[0])
         if not self.betting_round():
             return self.check_bankrupt()
 
@@ -153,16 +174,19 @@ class PokerGame:
 
     def get_bot_action(self, bot: Player) -> str:
         """Get bot decision."""
-        opp = self.get_opponent(bot)
-        bot_is_small_blind = (bot == self.players[0])
+        # Heads-up: the other seat is the opponent (nobody has folded yet,
+        # since a fold ends the hand before the next decision)
+        bot_is_small_blind = (bot is self.players[0])
+        opp = self.players[1] if bot_is_small_blind else self.players[0]
         
+        # Card lists are shared, not copied: bot_decision treats them as read-only
         state = {
-            "bot_hand": bot.hand.copy(),
-            "community": self.community.copy(),
+            "bot_hand": bot.hand,
+            "community": self.community,
             "pot": self.pot,
             "current_bet": self.current_bet,
             "bot_money": bot.money,
-            "opp_money": opp.money if opp else 0,
+            "opp_money": opp.money,
             "bot_current_bet": bot.current_bet,
             "raise_amount": 5,
             "terminal": False,
@@ -186,16 +210,20 @@ class PokerGame:
             return
 
         p1, p2 = active[0], active[1]
-        rank1 = self.evaluator.evaluate(self.community, p1.hand)
-        rank2 = self.evaluator.evaluate(self.community, p2.hand)
+        # Module-level lookup tables: nothing is built per showdown
+        rank1, rank2 = evaluate_hands(self.community, p1.hand, p2.hand)
 
         if rank1 < rank2:
             self.award_pot(p1)
         elif rank2 < rank1:
             self.award_pot(p2)
         else:
-            p1.money += self.pot // 2
-            p2.money += self.pot // 2
+            # Split with divmod so an odd pot keeps its chip; it goes to
+            # each seat on every other hand so neither bot is favoured
+            half, rem = divmod(self.pot, 2)
+            p1.money += half
+            p2.money += half
+            self.players[self.hands_played % 2].money += rem
 
     def award_pot(self, winner: Player):
         """Award pot."""
@@ -219,7 +247,10 @@ def print_statistics(player: Player):
     raise_pct = (log["raises"] / total) * 100
     check_pct = (log["checks"] / total) * 100
     
-    avg_time = sum(log["decision_times"]) / len(log["decision_times"]) if log["decision_times"] else 0
+    avg_time = log["sum_decision_time"] / total
+    # Population std-dev from the running sums (clamped against rounding)
+    std_time = math.sqrt(max(0.0, log["sumsq_decision_time"] / total - avg_time * avg_time))
+    avg_win_prob = log["sum_win_prob"] / total
     
     print(f"  {player.name}:")
     print(f"    Decisions: {total}")
@@ -227,7 +258,9 @@ def print_statistics(player: Player):
     print(f"    Call:  {log['calls']:3d} ({call_pct:5.1f}%)")
     print(f"    Raise: {log['raises']:3d} ({raise_pct:5.1f}%)")
     print(f"    Check: {log['checks']:3d} ({check_pct:5.1f}%)")
-    print(f"    Avg decision time: {avg_time:.3f}s")
+    print(f"    Avg decision time: {avg_time:.3f}s ± {std_time:.3f}s "
+          f"(min {log['min_decision_time']:.3f}s, max {log['max_decision_time']:.3f}s)")
+    print(f"    Avg win prob: {avg_win_prob:.1%}")
 
 
 def show_bot_info(config: Dict[str, Any]):
@@ -259,6 +292,33 @@ def show_bot_info(config: Dict[str, Any]):
     print()
 
 
+def _play_one_game(args: Tuple[str, str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]) -> Tuple[int, int, Dict[str, Any], Dict[str, Any]]:
+    """Play a single game in a worker process. Returns final money and bot logs."""
+    bot1_name, bot2_name, bot1_cfg, bot2_cfg, settings = args
+    player1 = Player(bot1_name.capitalize(), bot1_cfg["depth"], bot1_cfg["mc_sims"])
+    player2 = Player(bot2_name.capitalize(), bot2_cfg["depth"], bot2_cfg["mc_sims"])
+    player1.money = settings["starting_money"]
+    player2.money = settings["starting_money"]
+
+    game = PokerGame(player1, player2, settings["small_blind"], settings["big_blind"])
+    for _ in range(settings["rounds_per_game"]):
+        if not game.play_hand():
+            break
+
+    return player1.money, player2.money, player1.bot_log, player2.bot_log
+
+
+def _merge_bot_log(total: Dict[str, Any], log: Dict[str, Any]):
+    """Accumulate one game's bot log into the running total."""
+    for key, value in log.items():
+        if key == "min_decision_time":
+            total[key] = min(total[key], value)
+        elif key == "max_decision_time":
+            total[key] = max(total[key], value)
+        else:
+            total[key] += value
+
+
 def run_test(bot1_name: str, bot2_name: str, config: Dict[str, Any]):
     """Run test between two bots."""
     bot1_cfg = config["bots"][bot1_name]
@@ -274,36 +334,32 @@ def run_test(bot1_name: str, bot2_name: str, config: Dict[str, Any]):
     
     bot1_wins = 0
     bot2_wins = 0
-    
-    for game_num in range(settings["num_games"]):
-        player1 = Player(bot1_name.capitalize(), bot1_cfg["depth"], bot1_cfg["mc_sims"])
-        player2 = Player(bot2_name.capitalize(), bot2_cfg["depth"], bot2_cfg["mc_sims"])
-        player1.money = settings["starting_money"]
-        player2.money = settings["starting_money"]
-        
-        game = PokerGame(player1, player2, settings["small_blind"], settings["big_blind"])
-        
-        # Progress indicator
-        print(f"Game {game_num + 1}/{settings['num_games']}: ", end='', flush=True)
-        
-        for round_num in range(settings["rounds_per_game"]):
-            if not game.play_hand():
-                break
-            # Show progress dots
-            if (round_num + 1) % 5 == 0:
-                print('.', end='', flush=True)
-        
-        # Determine winner
-        if player1.money > player2.money:
-            bot1_wins += 1
-            winner = bot1_name
-        elif player2.money > player1.money:
-            bot2_wins += 1
-            winner = bot2_name  
-        else:
-            winner = "tie"
-        
-        print(f" ✓ {winner} (${player1.money} vs ${player2.money})")
+
+    # Aggregated statistics across all games
+    player1 = Player(bot1_name.capitalize(), bot1_cfg["depth"], bot1_cfg["mc_sims"])
+    player2 = Player(bot2_name.capitalize(), bot2_cfg["depth"], bot2_cfg["mc_sims"])
+
+    # Games are independent: play them in parallel worker processes
+    jobs = [(bot1_name, bot2_name, bot1_cfg, bot2_cfg, settings)] * settings["num_games"]
+    workers = max(1, min(os.cpu_count() or 1, len(jobs)))
+    with multiprocessing.Pool(workers) as pool:
+        for game_num, (money1, money2, log1, log2) in enumerate(pool.imap(_play_one_game, jobs)):
+            _merge_bot_log(player1.bot_log, log1)
+            _merge_bot_log(player2.bot_log, log2)
+
+            # Determine winner
+            if money1 > money2:
+                bot1_wins += 1
+                winner = bot1_name
+            elif money2 > money1:
+                bot2_wins += 1
+                winner = bot2_name
+            else:
+                winner = "tie"
+
+            # imap yields in game order, so each line can go out as soon as
+            # its game is done
+            print(f"Game {game_num + 1}/{settings['num_games']}: ✓ {winner} (${money1} vs ${money2})", flush=True)
     
     # Results
     print(f"\n📊 RESULTS:")
@@ -8,6 +8,9 @@ and game situation to make the bot's betting more realistic and unpredictable.
 import random
 from typing import Optional
 
+# Module-level alias of the global RNG method (saves the attribute lookup)
+_uniform = random.uniform
+
 
 def calculate_bet_size(
     win_prob: float,
@@ -42,23 +45,23 @@ def calculate_bet_size(
     """
     # Very strong hands: bet big for value (70-100% pot)
     if win_prob >= 0.85:
-        bet_pct = random.uniform(0.70, 1.00)
+        bet_pct = _uniform(0.70, 1.00)
     
     # Strong hands: value bet (60-75% pot)
     elif win_prob >= 0.70:
-        bet_pct = random.uniform(0.60, 0.75)
+        bet_pct = _uniform(0.60, 0.75)
     
     # Medium-strong: protection bet (40-60% pot)
     elif win_prob >= 0.55:
-        bet_pct = random.uniform(0.40, 0.60)
+        bet_pct = _uniform(0.40, 0.60)
     
     # Medium: smaller bet (25-40% pot)
     elif win_prob >= 0.45:
-        bet_pct = random.uniform(0.25, 0.40)
+        bet_pct = _uniform(0.25, 0.40)
     
     # Bluff territory: semi-bluff sizing (40-60% pot, same as value for balance)
     else:
-        bet_pct = random.uniform(0.40, 0.60)
+        bet_pct = _uniform(0.40, 0.60)
     
     # Calculate actual bet amount
     bet_amount = pot * bet_pct
@@ -8,10 +8,9 @@ This module implements the core bot intelligence using:
 """
 
 import random
-import copy
 import time
 from typing import List, Dict, Tuple, Optional, Any
-from treys import Evaluator, Deck
+from treys import Deck
 
 # Import configuration and constants
 from .constants import (
@@ -42,18 +41,35 @@ from .constants import (
     BLUFF_LATE_POSITION_BONUS,
     BLUFF_LARGE_POT_PENALTY,
     BLUFF_LARGE_POT_SIZE,
+    # Position adjustments
+    EARLY_POSITION_FOLD_INCREASE,
+    LATE_POSITION_FOLD_DECREASE,
+    EARLY_POSITION_RAISE_INCREASE,
+    LATE_POSITION_RAISE_DECREASE,
 )
 from .models import BOT_LOG_TEMPLATE
 from .bet_sizing import calculate_bet_size
-from .monte_carlo_parallel import monte_carlo_parallel
+from .monte_carlo_parallel import monte_carlo_parallel, available_cards, river_win_prob
+from .preflop_equity import preflop_equity
 
 # Global instances (will be refactored to dependency injection later)
-evaluator = Evaluator()
+# (hands are ranked by src/hand_eval.py, so no treys Evaluator is needed here)
 FULL_DECK = Deck()
 
+# Bluff roll; bound once instead of re-importing random in bot_decision
+_rand = random.random
+
 # Flag to enable/disable parallel Monte Carlo (can be toggled for testing)
 USE_PARALLEL_MONTE_CARLO = True
 
+# (bot_hand, community) -> (n_sim, win_prob) of the largest estimate so far.
+# The cards stay the same for every decision of a street, so a re-raise on
+# the same street reuses the estimate instead of simulating it again. The
+# entries are dropped as soon as an estimate for another board is asked
+# for, so only the current street is ever kept.
+_ESTIMATES: Dict[Tuple[Tuple[int, ...], Tuple[int, ...]], Tuple[int, float]] = {}
+_ESTIMATES_BOARD: Tuple[int, ...] = ()
+
 
 # ===============================
 # MONTE CARLO WIN PROBABILITY
@@ -62,7 +78,8 @@ USE_PARALLEL_MONTE_CARLO = True
 def monte_carlo_win_prob(
     bot_hand: List[int],
     community: List[int],
-    n_sim: int = 200
+    n_sim: int = 200,
+    available: Optional[List[int]] = None
 ) -> float:
     """
     Estimate win probability using Monte Carlo simulation.
@@ -70,15 +87,26 @@ def monte_carlo_win_prob(
     Simulates random opponent hands and community card completions to estimate
     the probability that the bot's hand will win at showdown.
     
-    Uses parallel Monte Carlo for n_sim >= 100 for better performance.
+    Uses parallel Monte Carlo for n_sim >= 100 for better performance. Both
+    paths share one kernel that samples only the opponent's hole cards and
+    the missing board cards per simulation (no full-deck shuffle).
+
+    Pre-flop (no community cards) the equity only depends on the hand's
+    169-class, so it is read from a precomputed table and n_sim is ignored.
+    On the river every opponent hand is enumerated instead, which gives
+    the exact probability (also ignoring n_sim).
     
     Args:
         bot_hand: List of card integers representing bot's hole cards
         community: List of card integers for community cards dealt so far
+            (both lists are only read, so callers may pass their own lists)
         n_sim: Number of simulations to run (higher = more accurate but slower)
+        available: Precomputed deck without the cards in play (optional)
     
     Returns:
-        Estimated win probability as a float between 0.0 and 1.0
+        Estimated win probability as a float between 0.0 and 1.0. A cached
+        estimate with at least n_sim simulations for the same cards is
+        returned as is.
         
     Example:
         >>> bot_hand = [Card.new('As'), Card.new('Kh')]
@@ -87,48 +115,70 @@ def monte_carlo_win_prob(
         >>> print(f"Win probability: {win_prob:.2%}")
         Win probability: 78.50%
     """
-    # Use parallel version for larger simulations (significant speedup)
-    if USE_PARALLEL_MONTE_CARLO and n_sim >= 100:
-        return monte_carlo_parallel(bot_hand, community, FULL_DECK.cards, n_sim)
-    
-    # Fallback to sequential implementation for small simulations
-    # Get all cards that are already in play
-    used = set(bot_hand + community)
-    deck_cards = [c for c in FULL_DECK.cards if c not in used]
+    # Pre-flop: constant per starting-hand class, no simulation needed
+    if not community:
+        return preflop_equity(bot_hand)
 
-    wins = 0.0
+    global _ESTIMATES_BOARD
     n_sim = max(1, n_sim)  # Ensure at least 1 simulation
+    key = (tuple(bot_hand), tuple(community))
+    if key[1] != _ESTIMATES_BOARD:
+        # New street or new hand: nothing cached can match any more
+        _ESTIMATES.clear()
+        _ESTIMATES_BOARD = key[1]
+    cached = _ESTIMATES.get(key)
+    if cached is not None and cached[0] >= n_sim:
+        return cached[1]
+
+    if len(community) == 5:
+        if available is None:
+            available = available_cards(FULL_DECK.cards, bot_hand, community)
+        win_prob = river_win_prob(bot_hand, community, available)
+        n_sim = max(n_sim, MC_SIMS_MAX)  # Exact: cache it as a full-size estimate
+    # Use parallel version for larger simulations (significant speedup)
+    elif USE_PARALLEL_MONTE_CARLO and n_sim >= 100:
+        win_prob = monte_carlo_parallel(bot_hand, community, FULL_DECK.cards, n_sim, available=available)
+    else:
+        # Sequential path: same simulation kernel, run on the calling thread
+        win_prob = monte_carlo_parallel(
+            bot_hand, community, FULL_DECK.cards, n_sim, max_workers=1, available=available
+        )
 
-    for _ in range(n_sim):
-        # Shuffle and deal random opponent hand
-        random.shuffle(deck_cards)
-        opp_hand = deck_cards[:2]
+    _ESTIMATES[key] = (n_sim, win_prob)
+    return win_prob
 
-        # Complete the community cards to 5 cards
-        sim_comm = community.copy()
-        idx = 2
-        while len(sim_comm) < 5:
-            sim_comm.append(deck_cards[idx])
-            idx += 1
 
-        # Evaluate both hands (lower score = better hand in treys)
-        bot_rank = evaluator.evaluate(sim_comm, bot_hand)
-        opp_rank = evaluator.evaluate(sim_comm, opp_hand)
+def decision_sims(depth: int, mc_sims: int) -> int:
+    """
+    Number of Monte Carlo simulations bot_decision runs for its estimate.
 
-        # Count wins and ties
-        if bot_rank < opp_rank:
-            wins += 1
-        elif bot_rank == opp_rank:
-            wins += 0.5  # Count ties as half a win
+    The estimate stays in-process: at MC_SIMS_MAX it takes a few ms on a
+    flop, and a process pool would start workers in the GUI and could not
+    run inside autotest's daemonic game workers.
 
-    return wins / n_sim
+    Args:
+        depth: Search depth of the bot
+        mc_sims: Configured simulation count of the bot
+
+    Returns:
+        mc_sims scaled with depth, clamped to [MC_SIMS_MIN, MC_SIMS_MAX]
+    """
+    return min(MC_SIMS_MAX, max(MC_SIMS_MIN, int(mc_sims * (1 + MC_SIMS_DEPTH_MULTIPLIER * (depth - 1)))))
 
 
 # ===============================
 # ACTION SPACE
 # ===============================
 
-def get_possible_actions(state: Dict[str, Any]) -> List[str]:
+# Shared, immutable action lists (no allocation per minimax node). The order
+# is also minimax's move order: the terminal/flat action (fold, check) comes
+# first, so every node gets a cheap alpha-beta bound before the raise line
+# deepens the tree.
+_ACTIONS_NO_BET: Tuple[str, ...] = ("check", "raise")
+_ACTIONS_FACING_BET: Tuple[str, ...] = ("fold", "call", "raise")
+
+
+def get_possible_actions(state: Dict[str, Any]) -> Tuple[str, ...]:
     """
     Get list of valid actions based on current game state.
     
@@ -136,11 +186,9 @@ def get_possible_actions(state: Dict[str, Any]) -> List[str]:
         state: Dictionary containing game state with 'current_bet' key
     
     Returns:
-        List of valid action strings: ['check', 'raise'] or ['fold', 'call', 'raise']
+        Tuple of valid action strings: ('check', 'raise') or ('fold', 'call', 'raise')
     """
-    if state["current_bet"] == 0:
-        return ["check", "raise"]
-    return ["fold", "call", "raise"]
+    return _ACTIONS_NO_BET if state["current_bet"] == 0 else _ACTIONS_FACING_BET
 
 
 # ===============================
@@ -155,8 +203,11 @@ def simulate_action(
     """
     Simulate the effect of an action on the game state.
     
-    Creates a deep copy of the state and applies the action to it, allowing
+    Creates a shallow copy of the state and applies the action to it, allowing
     MiniMax to explore future game states without modifying the current state.
+    Only scalar fields are reassigned; the card lists are shared read-only.
+    Actions that change nothing (check) return the input state itself, so
+    states must be treated as immutable once created.
     
     Args:
         state: Current game state dictionary
@@ -166,17 +217,16 @@ def simulate_action(
     Returns:
         New state dictionary after applying the action
     """
-    s = copy.deepcopy(state)
-    raise_amt = s["raise_amount"]
+    if action == "check":
+        return state
+
+    s = state.copy()
 
     if action == "fold":
         s["terminal"] = True
         s["winner"] = "opp" if actor == "bot" else "bot"
         return s
 
-    if action == "check":
-        return s
-
     if action == "call":
         to_call = s["current_bet"] - s["bot_current_bet"]
         to_call = max(0, to_call)
@@ -187,11 +237,8 @@ def simulate_action(
 
     if action == "raise":
         # Use dynamic bet sizing if provided, otherwise fall back to default
-        if "dynamic_raise" in s and s["dynamic_raise"]:
-            raise_amt = s["dynamic_raise"]
-        else:
-            raise_amt = s["raise_amount"]
-            
+        raise_amt = s.get("dynamic_raise") or s["raise_amount"]
+
         new_total = s["current_bet"] + raise_amt
         diff = new_total - s["bot_current_bet"]
         diff = max(0, diff)
@@ -209,7 +256,11 @@ def simulate_action(
 # STATE EVALUATION
 # ===============================
 
-def evaluate_state(state: Dict[str, Any], mc_sims: int = 120) -> float:
+def evaluate_state(
+    state: Dict[str, Any],
+    mc_sims: int = 120,
+    win_prob: Optional[float] = None
+) -> float:
     """
     Evaluate the current game state for the bot.
     
@@ -218,19 +269,29 @@ def evaluate_state(state: Dict[str, Any], mc_sims: int = 120) -> float:
     
     Args:
         state: Game state dictionary
-        mc_sims: Number of Monte Carlo simulations to run
+        mc_sims: Number of Monte Carlo simulations to run when win_prob
+            is not given
+        win_prob: Known win probability for these cards. Actions never
+            change the cards, so minimax passes the decision-level estimate
+            and the evaluation is pure arithmetic.
     
     Returns:
         Score representing the value of this state for the bot
     """
-    win_prob = monte_carlo_win_prob(state["bot_hand"], state["community"], mc_sims)
+    if win_prob is None:
+        win_prob = monte_carlo_win_prob(
+            state["bot_hand"], state["community"], mc_sims, state.get("available_deck")
+        )
     to_call = max(0, state["current_bet"] - state["bot_current_bet"])
     pot = state["pot"]
     raise_amt = state["raise_amount"]
 
-    # Expected value calculations
-    ev_call = win_prob * (pot + to_call) - (1 - win_prob) * to_call
-    ev_raise = win_prob * (pot + to_call + raise_amt) - (1 - win_prob) * (to_call + raise_amt)
+    # Expected value calculations. With edge = 2p - 1:
+    #   ev_call  = p * pot + edge * to_call
+    #   ev_raise = ev_call + edge * raise_amt
+    # so the better of the two only needs the sign of edge.
+    edge = 2 * win_prob - 1
+    best_ev = win_prob * pot + edge * (to_call + raise_amt if edge > 0 else to_call)
 
     # Bankroll ratio (avoid division by zero)
     total_money = state["bot_money"] + state["opp_money"]
@@ -247,7 +308,7 @@ def evaluate_state(state: Dict[str, Any], mc_sims: int = 120) -> float:
     # Combined score
     score = (
         WEIGHT_WIN_PROB * win_prob
-        + WEIGHT_EXPECTED_VALUE * max(ev_call, ev_raise) / (pot + 1)
+        + WEIGHT_EXPECTED_VALUE * best_ev / (pot + 1)
         + WEIGHT_BANKROLL_RATIO * bankroll_ratio
         + risk_penalty
     )
@@ -264,7 +325,8 @@ def minimax(
     depth: int,
     alpha: float,
     beta: float,
-    maximizing: bool
+    maximizing: bool,
+    win_prob: Optional[float] = None
 ) -> float:
     """
     MiniMax algorithm with Alpha-Beta pruning for optimal decision making.
@@ -278,6 +340,8 @@ def minimax(
         alpha: Best value the maximizer can guarantee (for pruning)
         beta: Best value the minimizer can guarantee (for pruning)
         maximizing: True if bot's turn (maximize), False if opponent's turn (minimize)
+        win_prob: Win probability shared by every node (the cards are fixed
+            within the search); estimated per leaf with Monte Carlo if None
     
     Returns:
         Score representing the value of the state for the bot
@@ -289,14 +353,14 @@ def minimax(
     """
     # Base cases: terminal state or max depth reached
     if state.get("terminal") or depth == 0:
-        return evaluate_state(state)
+        return evaluate_state(state, win_prob=win_prob)
 
     if maximizing:
         # Bot's turn: maximize score
         best = -1e9
         for action in get_possible_actions(state):
             s2 = simulate_action(state, action)
-            val = minimax(s2, depth - 1, alpha, beta, False)
+            val = minimax(s2, depth - 1, alpha, beta, False, win_prob)
             best = max(best, val)
             alpha = max(alpha, best)
             if beta <= alpha:
@@ -307,7 +371,7 @@ def minimax(
         worst = 1e9
         for action in get_possible_actions(state):
             s2 = simulate_action(state, action)
-            val = minimax(s2, depth - 1, alpha, beta, True)
+            val = minimax(s2, depth - 1, alpha, beta, True, win_prob)
             worst = min(worst, val)
             beta = min(beta, worst)
             if beta <= alpha:
@@ -319,6 +383,28 @@ def minimax(
 # MAIN BOT DECISION
 # ===============================
 
+# Decision thresholds per position, combined once at import:
+# is_early_position -> (fold, raise with no bet, raise facing a bet, bluff freq).
+# Early position (small blind) plays tighter: higher thresholds.
+# Late position (big blind) plays looser and bluffs more.
+_BASE_THRESHOLDS = (0.25, 0.50, 0.55)
+_POSITION_THRESHOLDS: Dict[bool, Tuple[float, float, float, float]] = {
+    # 30% fold, 55% raise, 60% raise facing bet
+    True: (
+        _BASE_THRESHOLDS[0] + EARLY_POSITION_FOLD_INCREASE,
+        _BASE_THRESHOLDS[1] + EARLY_POSITION_RAISE_INCREASE,
+        _BASE_THRESHOLDS[2] + EARLY_POSITION_RAISE_INCREASE,
+        BLUFF_BASE_FREQUENCY,
+    ),
+    # 22% fold, 47% raise, 52% raise facing bet
+    False: (
+        _BASE_THRESHOLDS[0] - LATE_POSITION_FOLD_DECREASE,
+        _BASE_THRESHOLDS[1] - LATE_POSITION_RAISE_DECREASE,
+        _BASE_THRESHOLDS[2] - LATE_POSITION_RAISE_DECREASE,
+        BLUFF_BASE_FREQUENCY + BLUFF_LATE_POSITION_BONUS,
+    ),
+}
+
 def bot_decision(
     state: Dict[str, Any],
     depth: int,
@@ -338,7 +424,8 @@ def bot_decision(
     This ensures the bot plays aggressively and adapts to position.
     
     Args:
-        state: Current game state dictionary
+        state: Current game state dictionary. The "bot_hand" and "community"
+            lists may be the caller's own lists and are treated as read-only.
         depth: How many moves ahead to search
         mc_sims: Number of Monte Carlo simulations to run
         log: Statistics tracking dictionary
@@ -347,11 +434,16 @@ def bot_decision(
         Action string: 'fold', 'check', 'call', or 'raise'
     """
     start = time.time()
+    # Deck without the cards in play, shared by every MC call of this decision
+    if state.get("available_deck") is None:
+        state["available_deck"] = available_cards(FULL_DECK.cards, state["bot_hand"], state["community"])
 
     # Scale simulations based on depth (deeper = more accurate)
-    sims = min(MC_SIMS_MAX, max(MC_SIMS_MIN, int(mc_sims * (1 + MC_SIMS_DEPTH_MULTIPLIER * (depth - 1)))))
-    win_prob = monte_carlo_win_prob(state["bot_hand"], state["community"], sims)
-    log["win_probs"].append(win_prob)
+    sims = decision_sims(depth, mc_sims)
+    win_prob = monte_carlo_win_prob(
+        state["bot_hand"], state["community"], sims, state["available_deck"]
+    )
+    log["sum_win_prob"] += win_prob
 
     to_call = max(0, state["current_bet"] - state["bot_current_bet"])
     pot = state["pot"]
@@ -362,22 +454,10 @@ def bot_decision(
     # Big blind = late position (acts last post-flop) = play looser
     is_early_position = state.get("bot_is_small_blind", False)
     
-    # Base thresholds
-    fold_threshold = 0.25
-    raise_threshold_no_bet = 0.50
-    raise_threshold_facing_bet = 0.55
-    
-    # Adjust thresholds based on position
-    if is_early_position:
-        # Early position: play tighter (higher thresholds)
-        fold_threshold += 0.05  # 30% in early position
-        raise_threshold_no_bet += 0.05  # 55% to raise
-        raise_threshold_facing_bet += 0.05  # 60% to raise facing bet
-    else:
-        # Late position: play looser (lower thresholds)
-        fold_threshold -= 0.03  # 22% in late position
-        raise_threshold_no_bet -= 0.03  # 47% to raise
-        raise_threshold_facing_bet -= 0.03  # 52% to raise facing bet
+    # Thresholds adjusted for position (see _POSITION_THRESHOLDS)
+    fold_threshold, raise_threshold_no_bet, raise_threshold_facing_bet, bluff_base = (
+        _POSITION_THRESHOLDS[bool(is_early_position)]
+    )
 
     # ===== SIMPLIFIED AGGRESSIVE STRATEGY =====
     
@@ -399,10 +479,10 @@ def bot_decision(
         elif win_prob >= raise_threshold_facing_bet:
             # Use MiniMax to decide if raising is better than calling
             call_state = simulate_action(state, "call")
-            call_value = minimax(call_state, depth - 1, -1e9, 1e9, False)
+            call_value = minimax(call_state, depth - 1, -1e9, 1e9, False, win_prob)
             
             raise_state = simulate_action(state, "raise")
-            raise_value = minimax(raise_state, depth - 1, -1e9, 1e9, False)
+            raise_value = minimax(raise_state, depth - 1, -1e9, 1e9, False, win_prob)
             
             # Raise if it's better than calling
             if raise_value > call_value - 0.05:  # Small threshold
@@ -412,20 +492,16 @@ def bot_decision(
         
         # BLUFF ZONE: Semi-bluff with medium-weak hands (30-45% equity)
         elif BLUFF_MIN_WIN_PROB <= win_prob < BLUFF_MAX_WIN_PROB:
-            # Calculate bluff frequency based on situation
-            bluff_freq = BLUFF_BASE_FREQUENCY
-            
-            # Bluff more in late position (better position)
-            if not is_early_position:
-                bluff_freq += BLUFF_LATE_POSITION_BONUS
+            # Calculate bluff frequency based on situation (the position
+            # bonus is already part of bluff_base)
+            bluff_freq = bluff_base
             
             # Bluff less in large pots (more risk)
             if pot > BLUFF_LARGE_POT_SIZE:
                 bluff_freq -= BLUFF_LARGE_POT_PENALTY
             
             # Decide whether to bluff
-            import random
-            if random.random() < bluff_freq:
+            if _rand() < bluff_freq:
                 action = "raise"  # BLUFF!
             else:
                 action = "call"  # Not this time
@@ -435,8 +511,14 @@ def bot_decision(
             action = "call"
 
     # ---- Update statistics ----
+    elapsed = time.time() - start
     log["decisions"] += 1
-    log["decision_times"].append(time.time() - start)
+    log["sum_decision_time"] += elapsed
+    log["sumsq_decision_time"] += elapsed * elapsed
+    if elapsed < log["min_decision_time"]:
+        log["min_decision_time"] = elapsed
+    if elapsed > log["max_decision_time"]:
+        log["max_decision_time"] = elapsed
     if action == "fold":
         log["folds"] += 1
     elif action == "call":
@@ -477,9 +559,10 @@ def bot_decision_wrapper(game: Any, bot_player: Any) -> str:
     bot_is_small_blind = (bot_player == game.players[0])  # First player is small blind
 
     # Convert game objects to state dictionary
+    # (card lists are passed by reference: the bot never mutates them)
     state = {
-        "bot_hand": bot_player.hand.copy(),
-        "community": game.community.copy(),
+        "bot_hand": bot_player.hand,
+        "community": game.community,
         "pot": game.pot,
         "current_bet": game.current_bet,
         "bot_money": bot_player.money,
@@ -488,15 +571,21 @@ def bot_decision_wrapper(game: Any, bot_player: Any) -> str:
         "raise_amount": DEFAULT_RAISE_AMOUNT,  # Fallback default
         "terminal": False,
         "bot_is_small_blind": bot_is_small_blind,  # Position tracking
+        # Built once here and reused by every Monte Carlo call of this decision
+        "available_deck": available_cards(FULL_DECK.cards, bot_player.hand, game.community),
     }
     
-    # Quick win prob estimate for bet sizing (using fewer sims for speed)
-    quick_sims = min(100, bot_player.mc_sims // 4)
-    quick_win_prob = monte_carlo_win_prob(state["bot_hand"], state["community"], quick_sims)
+    # Win prob estimate for bet sizing. It uses bot_decision's own simulation
+    # count, so the decision below reuses it from the cache instead of
+    # running a second Monte Carlo
+    win_prob = monte_carlo_win_prob(
+        state["bot_hand"], state["community"],
+        decision_sims(bot_player.depth, bot_player.mc_sims), state["available_deck"]
+    )
     
     # Calculate dynamic bet size based on hand strength
     dynamic_bet = calculate_bet_size(
-        win_prob=quick_win_prob,
+        win_prob=win_prob,
         pot=game.pot,
         current_bet=game.current_bet,
         bot_money=bot_player.money,
@@ -2,15 +2,41 @@
 Configuration management for PokerBot.
 
 This module provides type-safe configuration classes using dataclasses
-for game settings, bot configurations, and UI preferences.
+for game settings, bot configurations, and UI preferences. All of them use
+slots; the leaf configs are also frozen (and so hashable), only AppConfig
+swaps its sub-configs in place.
 """
 
-from dataclasses import dataclass, field
-from typing import Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Tuple
 from .constants import *
 
+# Description of bot levels 1-10 (index = level - 1)
+_LEVEL_DESCRIPTIONS = (
+    "Beginner: Quick decisions, basic strategy",
+    "Novice: Simple analysis, learning fundamentals",
+    "Casual: Reasonable play, good for practice",
+    "Intermediate: Solid fundamentals, challenges beginners",
+    "Competent: Balanced strategy, good opponent",
+    "Advanced: Strong analysis, competitive play",
+    "Expert: Deep thinking, difficult to beat",
+    "Master: Near-optimal decisions, very strong",
+    "Grandmaster: Exceptional play, rarely makes mistakes",
+    "World Class: Maximum analysis, extremely strong",
+)
 
-@dataclass
+# Thinking time by mc_sims: below _THINK_SIMS[i] -> _THINK_TIMES[i]
+_THINK_SIMS = (200, 1000, 3000)
+_THINK_TIMES = (
+    "<0.5s per decision",
+    "0.5-1s per decision",
+    "1-2s per decision",
+    "2-4s per decision",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class GameConfig:
     """Configuration for game rules and settings."""
     
@@ -32,13 +58,16 @@ class GameConfig:
             raise ValueError("Max rounds must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BotDifficultyConfig:
     """Configuration for bot AI difficulty levels."""
     
     level: int = 5
     depth: int = None
     mc_sims: int = None
+
+    # One shared (frozen) instance per level, see for_level
+    _by_level: ClassVar[Dict[int, "BotDifficultyConfig"]] = {}
     
     def __post_init__(self):
         """Calculate depth and mc_sims from level if not provided."""
@@ -46,42 +75,34 @@ class BotDifficultyConfig:
             raise ValueError(f"Bot level must be between {BOT_LEVEL_MIN} and {BOT_LEVEL_MAX}")
         
         # Auto-calculate depth and mc_sims from level if not explicitly set
+        # (frozen, so the derived defaults bypass the dataclass __setattr__)
         if self.depth is None:
-            self.depth = self.level
+            object.__setattr__(self, "depth", self.level)
         
         if self.mc_sims is None:
-            self.mc_sims = MC_SIMS_BASE + (self.level - 1) * MC_SIMS_PER_LEVEL
+            object.__setattr__(self, "mc_sims", MC_SIMS_BASE + (self.level - 1) * MC_SIMS_PER_LEVEL)
+
+    @classmethod
+    def for_level(cls, level: int) -> 'BotDifficultyConfig':
+        """Get the derived config for a level, built once per level."""
+        config = cls._by_level.get(level)
+        if config is None:
+            config = cls._by_level[level] = cls(level=level)
+        return config
     
     def get_description(self) -> str:
         """Get human-readable description of this difficulty level."""
-        descriptions = {
-            1: "Beginner: Quick decisions, basic strategy",
-            2: "Novice: Simple analysis, learning fundamentals",
-            3: "Casual: Reasonable play, good for practice",
-            4: "Intermediate: Solid fundamentals, challenges beginners",
-            5: "Competent: Balanced strategy, good opponent",
-            6: "Advanced: Strong analysis, competitive play",
-            7: "Expert: Deep thinking, difficult to beat",
-            8: "Master: Near-optimal decisions, very strong",
-            9: "Grandmaster: Exceptional play, rarely makes mistakes",
-            10: "World Class: Maximum analysis, extremely strong"
-        }
-        return descriptions.get(self.level, "Unknown")
+        if 1 <= self.level <= len(_LEVEL_DESCRIPTIONS):
+            return _LEVEL_DESCRIPTIONS[self.level - 1]
+        return "Unknown"
     
     def get_thinking_time_estimate(self) -> str:
         """Estimate average thinking time for this difficulty."""
         # Rough estimate based on mc_sims
-        if self.mc_sims < 200:
-            return "<0.5s per decision"
-        elif self.mc_sims < 1000:
-            return "0.5-1s per decision"
-        elif self.mc_sims < 3000:
-            return "1-2s per decision"
-        else:
-            return "2-4s per decision"
+        return _THINK_TIMES[bisect_right(_THINK_SIMS, self.mc_sims)]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UIConfig:
     """Configuration for UI appearance and behavior."""
     
@@ -113,7 +134,7 @@ class UIConfig:
         return (self.screen_width, self.screen_height)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AITuningConfig:
     """Configuration for AI decision-making parameters."""
     
@@ -138,14 +159,24 @@ class AITuningConfig:
             raise ValueError(f"Evaluation weights must sum to 1.0, got {total_weight}")
 
 
-@dataclass
+# Preset sub-configs. They are frozen, so every AppConfig shares the same
+# validated instances and only the (mutable) AppConfig shell is new.
+_DEFAULT_GAME = GameConfig()
+_DEFAULT_BOT = BotDifficultyConfig()
+_DEFAULT_UI = UIConfig()
+_DEFAULT_AI_TUNING = AITuningConfig()
+_BEGINNER_GAME = GameConfig(starting_money=200, small_blind=1, big_blind=2)
+_EXPERT_GAME = GameConfig(starting_money=100, small_blind=5, big_blind=10)
+
+
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration combining all sub-configs."""
     
-    game: GameConfig = field(default_factory=GameConfig)
-    bot: BotDifficultyConfig = field(default_factory=BotDifficultyConfig)
-    ui: UIConfig = field(default_factory=UIConfig)
-    ai_tuning: AITuningConfig = field(default_factory=AITuningConfig)
+    game: GameConfig = _DEFAULT_GAME
+    bot: BotDifficultyConfig = _DEFAULT_BOT
+    ui: UIConfig = _DEFAULT_UI
+    ai_tuning: AITuningConfig = _DEFAULT_AI_TUNING
     
     @classmethod
     def create_default(cls) -> 'AppConfig':
@@ -156,21 +187,21 @@ class AppConfig:
     def create_beginner(cls) -> 'AppConfig':
         """Create configuration for beginner players."""
         return cls(
-            game=GameConfig(starting_money=200, small_blind=1, big_blind=2),
-            bot=BotDifficultyConfig(level=2)
+            game=_BEGINNER_GAME,
+            bot=BotDifficultyConfig.for_level(2)
         )
     
     @classmethod
     def create_expert(cls) -> 'AppConfig':
         """Create configuration for expert players."""
         return cls(
-            game=GameConfig(starting_money=100, small_blind=5, big_blind=10),
-            bot=BotDifficultyConfig(level=9)
+            game=_EXPERT_GAME,
+            bot=BotDifficultyConfig.for_level(9)
         )
     
     def update_bot_level(self, level: int):
         """Update bot difficulty level."""
-        self.bot = BotDifficultyConfig(level=level)
+        self.bot = BotDifficultyConfig.for_level(level)
 
 
 # Global default configuration
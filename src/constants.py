@@ -117,6 +117,7 @@ BUTTON_HEIGHT = 50
 LOG_LINE_HEIGHT = 20
 LOG_MAX_LINES = 200
 LOG_SCROLL_SPEED = 25
+LOG_VERBOSE = True  # Echo every game log line to stdout (slow on some terminals)
 
 # Particle effects
 PARTICLE_COUNT = 25
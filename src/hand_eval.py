@@ -0,0 +1,274 @@
+"""
+Fast hand evaluation for PokerBot.
+
+This module builds a few extra lookup tables on top of treys' Cactus Kev
+tables so that 5-7 card hands can be ranked with one pass over the cards
+and one or two table lookups, instead of treys' 21 five-card evaluations
+per 7-card hand. Ranks are identical to treys.Evaluator: 1 is a royal
+flush and 7462 is the worst high card (lower = better).
+"""
+
+import itertools
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from treys import Card, Deck
+from treys.lookup import LookupTable
+
+_TABLE = LookupTable()
+
+
+def _build_flush_table() -> List[int]:
+    """
+    Best flush / straight-flush rank for every 13-bit rank mask.
+
+    Masks with exactly 5 bits come straight from treys. Masks with 6 or 7
+    bits (6-7 suited cards) take the best of their 5-bit subsets, so a
+    whole suited group is ranked with a single list index.
+    """
+    table = [0] * 8192
+    for bits in range(8192):
+        if bin(bits).count("1") == 5:
+            table[bits] = _TABLE.flush_lookup[Card.prime_product_from_rankbits(bits)]
+    for size in (6, 7):
+        for bits in range(8192):
+            if bin(bits).count("1") == size:
+                table[bits] = min(
+                    table[bits & ~(1 << i)] for i in range(13) if bits & (1 << i)
+                )
+    return table
+
+
+FLUSH_TABLE = _build_flush_table()
+
+# Suit bit (c >> 12 & 0xF) -> one nibble counter per suit
+_SUIT_NIBBLE = (0, 1, 1 << 4, 0, 1 << 8, 0, 0, 0, 1 << 12)
+
+# Card int -> its suit's nibble counter: one dict lookup per card in the hot
+# loops instead of shift + mask + tuple index
+_CARD_NIBBLE: Dict[int, int] = {
+    c: _SUIT_NIBBLE[(c >> 12) & 0xF] for c in Deck.GetFullDeck()
+}
+
+# Nibble overflow bit (count >= 5) -> treys suit mask of that suit
+_FLUSH_SUIT = {0x8: 0x1000, 0x80: 0x2000, 0x800: 0x4000, 0x8000: 0x8000}
+
+# Prime product of a non-flush hand -> rank. Seeded with treys' 5-card
+# table; 6/7-card products are filled in lazily on first sight (there are
+# only ~50k distinct 7-card rank multisets).
+_UNSUITED: Dict[int, int] = dict(_TABLE.unsuited_lookup)
+
+
+def _unsuited_rank(cards: Sequence[int], product: int) -> int:
+    """Rank a 6/7-card non-flush hand from its 5-card subsets and memoize it."""
+    unsuited = _TABLE.unsuited_lookup
+    rank = LookupTable.MAX_HIGH_CARD
+    primes = [c & 0xFF for c in cards]
+    for a, b, c, d, e in itertools.combinations(primes, 5):
+        r = unsuited[a * b * c * d * e]
+        if r < rank:
+            rank = r
+    _UNSUITED[product] = rank
+    return rank
+
+
+def evaluate_cards(cards: Sequence[int]) -> int:
+    """
+    Rank a hand of 5, 6 or 7 treys card integers.
+
+    Args:
+        cards: Hole cards and board cards together, in any order
+
+    Returns:
+        Hand rank in [1, 7462], lower is better (same scale as treys)
+    """
+    counts = 0
+    product = 1
+    for c in cards:
+        counts += _CARD_NIBBLE[c]
+        product *= c & 0xFF
+
+    # Adding 3 to every nibble sets its top bit iff that suit has 5+ cards
+    flush = (counts + 0x3333) & 0x8888
+    if flush:
+        # With 5+ suited cards out of 7 a full house or quads is impossible,
+        # so the best flush is the best hand
+        suit = _FLUSH_SUIT[flush]
+        bits = 0
+        for c in cards:
+            if c & suit:
+                bits |= c >> 16
+        return FLUSH_TABLE[bits]
+
+    rank = _UNSUITED.get(product)
+    if rank is None:
+        rank = _unsuited_rank(cards, product)
+    return rank
+
+
+def evaluate_hands(board: Sequence[int], *holes: Sequence[int]) -> List[int]:
+    """
+    Rank several players' hole cards against one shared board.
+
+    The board's suit counters and prime product are folded once and reused
+    for every player, so only the two hole cards are added per hand.
+
+    Args:
+        board: Community cards (3-5 cards)
+        *holes: One 2-card hand per player
+
+    Returns:
+        One hand rank per hole-card pair, in the same order (lower is better)
+    """
+    board_counts = 0
+    board_product = 1
+    for c in board:
+        board_counts += _CARD_NIBBLE[c]
+        board_product *= c & 0xFF
+
+    ranks = []
+    for hole in holes:
+        counts = board_counts
+        product = board_product
+        for c in hole:
+            counts += _CARD_NIBBLE[c]
+            product *= c & 0xFF
+
+        flush = (counts + 0x3333) & 0x8888
+        if flush:
+            suit = _FLUSH_SUIT[flush]
+            bits = 0
+            for c in board:
+                if c & suit:
+                    bits |= c >> 16
+            for c in hole:
+                if c & suit:
+                    bits |= c >> 16
+            ranks.append(FLUSH_TABLE[bits])
+            continue
+
+        rank = _UNSUITED.get(product)
+        if rank is None:
+            rank = _unsuited_rank(list(board) + list(hole), product)
+        ranks.append(rank)
+    return ranks
+
+
+def specialize_board(
+    community: Sequence[int], hand: Sequence[int]
+) -> Callable[[Sequence[int], Sequence[int]], Tuple[int, int]]:
+    """
+    Build a ranker with the known community cards and our hand folded in.
+
+    During one Monte Carlo batch the community cards dealt so far and the
+    bot's hand never change; only the runout and the opponent's hand do.
+    The returned function therefore only folds those 3-4 random cards into
+    pre-accumulated suit counters, prime products and per-suit rank bits.
+
+    Args:
+        community: Community cards dealt so far (0-5 cards)
+        hand: Our hole cards
+
+    Returns:
+        rank(runout, opp_hand) -> (our_rank, opp_rank), lower is better
+    """
+    community = list(community)
+    hand = list(hand)
+    board_counts = 0
+    board_product = 1
+    for c in community:
+        board_counts += _CARD_NIBBLE[c]
+        board_product *= c & 0xFF
+    hand_counts = 0
+    hand_product = 1
+    for c in hand:
+        hand_counts += _CARD_NIBBLE[c]
+        hand_product *= c & 0xFF
+
+    # Rank bits per suit (keyed by the suit's nibble overflow bit), so a flush
+    # only ORs in the random cards: board alone (opponent) and board + hand
+    board_bits = {}
+    our_bits = {}
+    for flush_bit, suit in _FLUSH_SUIT.items():
+        bits = 0
+        for c in community:
+            if c & suit:
+                bits |= c >> 16
+        board_bits[flush_bit] = bits
+        for c in hand:
+            if c & suit:
+                bits |= c >> 16
+        our_bits[flush_bit] = bits
+
+    nibble = _CARD_NIBBLE
+    flush_suit = _FLUSH_SUIT
+    flush_table = FLUSH_TABLE
+    unsuited = _UNSUITED
+
+    def rank(runout: Sequence[int], opp_hand: Sequence[int]) -> Tuple[int, int]:
+        counts = board_counts
+        product = board_product
+        for c in runout:
+            counts += nibble[c]
+            product *= c & 0xFF
+
+        ours = counts + hand_counts
+        ours_product = product * hand_product
+        flush = (ours + 0x3333) & 0x8888
+        if flush:
+            suit = flush_suit[flush]
+            bits = our_bits[flush]
+            for c in runout:
+                if c & suit:
+                    bits |= c >> 16
+            our_rank = flush_table[bits]
+        else:
+            our_rank = unsuited.get(ours_product)
+            if our_rank is None:
+                our_rank = _unsuited_rank(community + list(runout) + hand, ours_product)
+
+        for c in opp_hand:
+            counts += nibble[c]
+            product *= c & 0xFF
+        flush = (counts + 0x3333) & 0x8888
+        if flush:
+            suit = flush_suit[flush]
+            bits = board_bits[flush]
+            for c in runout:
+                if c & suit:
+                    bits |= c >> 16
+            for c in opp_hand:
+                if c & suit:
+                    bits |= c >> 16
+            opp_rank = flush_table[bits]
+        else:
+            opp_rank = unsuited.get(product)
+            if opp_rank is None:
+                opp_rank = _unsuited_rank(community + list(runout) + list(opp_hand), product)
+        return our_rank, opp_rank
+
+    if len(community) == 5:
+        # River: the runout is always empty, so our rank is a constant and
+        # each simulation only has to rank the opponent's hand
+        our_river_rank = evaluate_cards(community + hand)
+
+        def rank_river(runout: Sequence[int], opp_hand: Sequence[int]) -> Tuple[int, int]:
+            a, b = opp_hand
+            counts = board_counts + nibble[a] + nibble[b]
+            product = board_product * (a & 0xFF) * (b & 0xFF)
+            flush = (counts + 0x3333) & 0x8888
+            if flush:
+                suit = flush_suit[flush]
+                bits = board_bits[flush]
+                if a & suit:
+                    bits |= a >> 16
+                if b & suit:
+                    bits |= b >> 16
+                return our_river_rank, flush_table[bits]
+            opp_rank = unsuited.get(product)
+            if opp_rank is None:
+                opp_rank = _unsuited_rank(community + [a, b], product)
+            return our_river_rank, opp_rank
+
+        return rank_river
+
+    return rank
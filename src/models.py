@@ -252,19 +252,26 @@ class HandHistory:
 # Legacy Compatibility
 # =========================
 
-# For backward compatibility with existing code
-BOT_LOG_TEMPLATE = {
-    "decisions": 0,
-    "folds": 0,
-    "raises": 0,
-    "calls": 0,
-    "checks": 0,
-    "decision_times": [],
-    "win_probs": [],
-    "rounds": {
-        "total": 0,
-        "bot_wins": 0,
-        "player_wins": 0,
-        "ties": 0
+def new_bot_log() -> Dict[str, float]:
+    """
+    Fresh bot statistics dict as used by bot_decision().
+
+    All values are scalars (running sums instead of per-decision lists), so
+    memory stays O(1) however many decisions are logged.
+    """
+    return {
+        "decisions": 0,
+        "folds": 0,
+        "raises": 0,
+        "calls": 0,
+        "checks": 0,
+        "sum_win_prob": 0.0,
+        "sum_decision_time": 0.0,
+        "sumsq_decision_time": 0.0,  # for the variance of decision times
+        "min_decision_time": float("inf"),
+        "max_decision_time": 0.0,
     }
-}
+
+
+# For backward compatibility with existing code (prefer new_bot_log())
+BOT_LOG_TEMPLATE = new_bot_log()
@@ -2,14 +2,38 @@
 Multithreaded Monte Carlo simulation for poker win probability estimation.
 
 This module provides a parallel implementation of Monte Carlo simulation
-using ThreadPoolExecutor for significant performance improvements.
+using ThreadPoolExecutor. The kernel is pure Python, so under CPython's
+GIL the worker threads interleave rather than run on separate cores: the
+speed comes from the kernel itself (lookup evaluator, partial shuffles).
+Real multi-core fan-out happens one level up, where autotest plays whole
+games in separate processes.
 """
 
+import itertools
 import random
-from typing import List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import multiprocessing
-from treys import Evaluator
+import threading
+from .hand_eval import specialize_board
+
+# Worker threads live for the whole process instead of being spawned and
+# joined on every call; they share the caller's card lists directly.
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_WORKERS = 0
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared thread pool, (re)creating it if it must grow."""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_WORKERS < max_workers:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mc")
+            _EXECUTOR_WORKERS = max_workers
+        return _EXECUTOR
 
 
 def monte_carlo_parallel(
@@ -17,98 +41,164 @@ def monte_carlo_parallel(
     community: List[int],
     full_deck_cards: List[int],
     n_sim: int = 200,
-    max_workers: int = None
+    max_workers: int = None,
+    available: Optional[List[int]] = None
 ) -> float:
     """
     Estimate win probability using parallel Monte Carlo simulation.
     
-    Splits simulations across multiple threads for 3-4x speedup on multi-core systems.
+    Splits simulations across worker threads (see the module docstring for
+    why this does not scale with cores for the pure-Python kernel).
     
     Args:
         bot_hand: List of card integers representing bot's hole cards
         community: List of card integers for community cards dealt so far
+            (both lists are only read, so callers may pass their own lists)
         full_deck_cards: Full deck of cards (from FULL_DECK.cards)
         n_sim: Number of simulations to run (higher = more accurate but slower)
         max_workers: Number of threads (default: min(4, CPU count))
+        available: Precomputed deck minus the cards in play (optional; built
+            from full_deck_cards when omitted). Only read, never mutated.
     
     Returns:
         Estimated win probability as a float between 0.0 and 1.0
     """
     if max_workers is None:
         max_workers = min(4, multiprocessing.cpu_count())
+    if available is None:
+        available = available_cards(full_deck_cards, bot_hand, community)
     
-    # For small simulations, threading overhead isn't worth it
-    if n_sim < 100:
-        return _run_simulations_batch(bot_hand, community, full_deck_cards, n_sim)
+    # For small simulations (or a single worker), threading overhead isn't worth it
+    if n_sim < 100 or max_workers == 1:
+        return _run_simulations_batch(bot_hand, community, available, n_sim) / n_sim
     
     # Split simulations across workers
     sims_per_worker = n_sim // max_workers
     remaining_sims = n_sim % max_workers
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = []
-        
-        # Submit batches to workers
-        for i in range(max_workers):
-            batch_size = sims_per_worker + (1 if i < remaining_sims else 0)
-            future = executor.submit(
-                _run_simulations_batch,
-                bot_hand, community, full_deck_cards, batch_size
-            )
-            futures.append(future)
-        
-        # Collect results as they complete
-        total_wins = sum(f.result() for f in as_completed(futures))
+    executor = _get_executor(max_workers)
+    futures = []
+
+    # Submit batches to workers
+    for i in range(max_workers):
+        batch_size = sims_per_worker + (1 if i < remaining_sims else 0)
+        future = executor.submit(
+            _run_simulations_batch,
+            bot_hand, community, available, batch_size
+        )
+        futures.append(future)
+
+    # Collect results (the sum does not depend on completion order)
+    total_wins = sum(f.result() for f in futures)
     
     return total_wins / n_sim
 
 
+def available_cards(
+    full_deck_cards: List[int],
+    bot_hand: List[int],
+    community: List[int]
+) -> List[int]:
+    """
+    Cards still left in the deck once the bot's hand and the board are dealt.
+
+    Args:
+        full_deck_cards: Full deck of cards
+        bot_hand: Bot's hole cards
+        community: Community cards
+
+    Returns:
+        List of card integers not in play
+    """
+    used = set(bot_hand)
+    used.update(community)
+    return [c for c in full_deck_cards if c not in used]
+
+
+def river_win_prob(
+    bot_hand: List[int],
+    community: List[int],
+    deck_cards: List[int]
+) -> float:
+    """
+    Exact win probability on the river by enumerating every opponent hand.
+
+    With all 5 community cards dealt the only unknowns are the opponent's
+    hole cards: C(45, 2) = 990 pairs, which is cheaper to enumerate than a
+    few hundred random simulations (no draws, and our rank is fixed).
+
+    Args:
+        bot_hand: Bot's hole cards
+        community: The 5 community cards
+        deck_cards: Cards not in play (read-only)
+
+    Returns:
+        Share of opponent hands we beat (ties count half), 0.0 to 1.0
+    """
+    rank = specialize_board(community, bot_hand)
+    wins = 0
+    ties = 0
+    pairs = 0
+    for opp_hand in itertools.combinations(deck_cards, 2):
+        bot_rank, opp_rank = rank((), opp_hand)
+        if bot_rank < opp_rank:
+            wins += 1
+        elif bot_rank == opp_rank:
+            ties += 1
+        pairs += 1
+    return (wins + 0.5 * ties) / pairs
+
+
 def _run_simulations_batch(
     bot_hand: List[int],
     community: List[int],
-    full_deck_cards: List[int],
+    deck_cards: List[int],
     n_sim: int
 ) -> float:
     """
-    Run a batch of Monte Carlo simulations (called by worker threads).
+    Run a batch of Monte Carlo simulations.
+
+    This is the single simulation kernel shared by the threaded and the
+    sequential paths; hot callables are bound to locals and the fixed
+    board is specialized before the loop.
     
     Args:
         bot_hand: Bot's hole cards
         community: Community cards
-        full_deck_cards: Full deck of cards
+        deck_cards: Cards not in play (shared between batches, read-only)
         n_sim: Number of simulations in this batch
     
     Returns:
         Number of wins (including half-wins for ties) in this batch
     """
-    evaluator = Evaluator()
-    
-    # Get cards that are already in play
-    used = set(bot_hand + community)
-    deck_cards = [c for c in full_deck_cards if c not in used]
-    
-    wins = 0.0
+    wins = 0
+    ties = 0
+    rand = random.random
+    # Known community cards and the bot's hand are fixed for the whole batch,
+    # so fold them into a specialized ranker once
+    rank = specialize_board(community, bot_hand)
+    # Only the opponent's 2 cards and the missing board cards are ever looked
+    # at, so draw just those with a partial Fisher-Yates shuffle: each of the
+    # first n_draw slots is swapped with a uniform pick from the rest. The
+    # batch works on its own copy since deck_cards is shared between threads.
+    n_draw = 2 + (5 - len(community))
+    deck = list(deck_cards)
+    n_deck = len(deck)
+    picks = [(j, n_deck - j) for j in range(n_draw)]
     
     for _ in range(n_sim):
-        # Shuffle and deal random opponent hand
-        random.shuffle(deck_cards)
-        opp_hand = deck_cards[:2]
-        
-        # Complete the community cards to 5 cards
-        sim_comm = community.copy()
-        idx = 2
-        while len(sim_comm) < 5:
-            sim_comm.append(deck_cards[idx])
-            idx += 1
+        # Deal random opponent hand + the rest of the board
+        for j, span in picks:
+            i = j + int(rand() * span)
+            deck[j], deck[i] = deck[i], deck[j]
         
-        # Evaluate both hands (lower score = better hand in treys)
-        bot_rank = evaluator.evaluate(sim_comm, bot_hand)
-        opp_rank = evaluator.evaluate(sim_comm, opp_hand)
+        # Evaluate both hands (lower score = better hand, same scale as treys)
+        bot_rank, opp_rank = rank(deck[2:n_draw], deck[:2])
         
-        # Count wins and ties
+        # Count wins and ties as ints; ties are weighted once at the end
         if bot_rank < opp_rank:
             wins += 1
         elif bot_rank == opp_rank:
-            wins += 0.5  # Count ties as half a win
+            ties += 1
     
-    return wins
+    return wins + 0.5 * ties  # Count ties as half a win
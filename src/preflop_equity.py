@@ -0,0 +1,137 @@
+"""
+Pre-flop equity lookup for PokerBot.
+
+Heads-up, with no community cards dealt, a hand's equity against one random
+opponent hand depends only on its two ranks and whether it is suited: there
+are 169 such classes. Their equities are fixed constants, so pre-flop win
+probabilities are looked up here instead of being simulated.
+
+Values are win + tie/2 against a random hand (the same measure as the Monte
+Carlo kernel), estimated once with 120k simulations per class. To regenerate
+the table, run the shared kernel for every class and paste the output:
+
+    python -m src.preflop_equity [sims_per_class] [seed]
+
+(defaults 120000 and 0, about two minutes; it reproduces this table to
+within 0.006, 0.0015 on average).
+"""
+
+import sys
+from typing import Dict, Iterator, Sequence
+
+from treys import Card
+
+_RANK_CHARS = "23456789TJQKA"
+
+# Canonical class ("AA", "AKs", "AKo", ...) -> equity vs one random hand
+PREFLOP_EQUITY: Dict[str, float] = {
+    "AA": 0.853, "AKs": 0.672, "AKo": 0.655, "AQs": 0.661, "AQo": 0.644,
+    "AJs": 0.652, "AJo": 0.634, "ATs": 0.646, "ATo": 0.628, "A9s": 0.628,
+    "A9o": 0.609, "A8s": 0.618, "A8o": 0.601, "A7s": 0.609, "A7o": 0.586,
+    "A6s": 0.600, "A6o": 0.576, "A5s": 0.598, "A5o": 0.577, "A4s": 0.590,
+    "A4o": 0.569, "A3s": 0.582, "A3o": 0.556, "A2s": 0.574, "A2o": 0.548,
+    "KK": 0.822, "KQs": 0.633, "KQo": 0.614, "KJs": 0.626, "KJo": 0.605,
+    "KTs": 0.619, "KTo": 0.598, "K9s": 0.598, "K9o": 0.578, "K8s": 0.584,
+    "K8o": 0.560, "K7s": 0.575, "K7o": 0.552, "K6s": 0.567, "K6o": 0.543,
+    "K5s": 0.557, "K5o": 0.533, "K4s": 0.550, "K4o": 0.523, "K3s": 0.542,
+    "K3o": 0.514, "K2s": 0.532, "K2o": 0.505,
+    "QQ": 0.800, "QJs": 0.602, "QJo": 0.582, "QTs": 0.593, "QTo": 0.572,
+    "Q9s": 0.574, "Q9o": 0.553, "Q8s": 0.560, "Q8o": 0.537, "Q7s": 0.542,
+    "Q7o": 0.520, "Q6s": 0.535, "Q6o": 0.511, "Q5s": 0.528, "Q5o": 0.501,
+    "Q4s": 0.518, "Q4o": 0.491, "Q3s": 0.508, "Q3o": 0.483, "Q2s": 0.503,
+    "Q2o": 0.475,
+    "JJ": 0.774, "JTs": 0.574, "JTo": 0.552, "J9s": 0.556, "J9o": 0.531,
+    "J8s": 0.540, "J8o": 0.515, "J7s": 0.524, "J7o": 0.497, "J6s": 0.506,
+    "J6o": 0.480, "J5s": 0.501, "J5o": 0.472, "J4s": 0.491, "J4o": 0.461,
+    "J3s": 0.483, "J3o": 0.453, "J2s": 0.474, "J2o": 0.443,
+    "TT": 0.751, "T9s": 0.539, "T9o": 0.516, "T8s": 0.525, "T8o": 0.496,
+    "T7s": 0.507, "T7o": 0.477, "T6s": 0.487, "T6o": 0.461, "T5s": 0.470,
+    "T5o": 0.444, "T4s": 0.464, "T4o": 0.437, "T3s": 0.456, "T3o": 0.427,
+    "T2s": 0.447, "T2o": 0.416,
+    "99": 0.721, "98s": 0.508, "98o": 0.483, "97s": 0.490, "97o": 0.461,
+    "96s": 0.474, "96o": 0.446, "95s": 0.457, "95o": 0.426, "94s": 0.439,
+    "94o": 0.405, "93s": 0.432, "93o": 0.402, "92s": 0.423, "92o": 0.389,
+    "88": 0.692, "87s": 0.479, "87o": 0.449, "86s": 0.461, "86o": 0.433,
+    "85s": 0.445, "85o": 0.413, "84s": 0.428, "84o": 0.396, "83s": 0.408,
+    "83o": 0.376, "82s": 0.402, "82o": 0.367,
+    "77": 0.661, "76s": 0.452, "76o": 0.423, "75s": 0.435, "75o": 0.404,
+    "74s": 0.417, "74o": 0.386, "73s": 0.399, "73o": 0.368, "72s": 0.384,
+    "72o": 0.346,
+    "66": 0.632, "65s": 0.432, "65o": 0.401, "64s": 0.412, "64o": 0.381,
+    "63s": 0.394, "63o": 0.359, "62s": 0.375, "62o": 0.342,
+    "55": 0.603, "54s": 0.415, "54o": 0.383, "53s": 0.395, "53o": 0.360,
+    "52s": 0.378, "52o": 0.344,
+    "44": 0.570, "43s": 0.389, "43o": 0.349, "42s": 0.365, "42o": 0.333,
+    "33": 0.537, "32s": 0.362, "32o": 0.322,
+    "22": 0.503,
+}
+
+
+def canonicalize(hand: Sequence[int]) -> str:
+    """
+    Canonical 169-class key of two treys card ints.
+
+    Args:
+        hand: The two hole cards
+
+    Returns:
+        Key like "AA", "AKs" or "T9o" (higher rank first)
+    """
+    c1, c2 = hand
+    r1 = Card.get_rank_int(c1)
+    r2 = Card.get_rank_int(c2)
+    if r1 < r2:
+        r1, r2 = r2, r1
+    key = _RANK_CHARS[r1] + _RANK_CHARS[r2]
+    if r1 == r2:
+        return key
+    return key + ("s" if Card.get_suit_int(c1) == Card.get_suit_int(c2) else "o")
+
+
+def preflop_equity(hand: Sequence[int]) -> float:
+    """
+    Heads-up pre-flop equity of two hole cards against a random hand.
+
+    Args:
+        hand: The two hole cards
+
+    Returns:
+        Equity between 0.0 and 1.0
+    """
+    return PREFLOP_EQUITY[canonicalize(hand)]
+
+
+def _classes() -> Iterator[str]:
+    """Every class key in table order: per high rank the pair, then s/o pairs."""
+    for hi in range(12, -1, -1):
+        yield _RANK_CHARS[hi] * 2
+        for lo in range(hi - 1, -1, -1):
+            yield _RANK_CHARS[hi] + _RANK_CHARS[lo] + "s"
+            yield _RANK_CHARS[hi] + _RANK_CHARS[lo] + "o"
+
+
+def _simulate_table(sims: int, seed: int) -> Dict[str, float]:
+    """Estimate every class with the Monte Carlo kernel (seeded, one thread)."""
+    # Only the generator needs the kernel, so the lookup stays import-light
+    import random
+    from .monte_carlo_parallel import monte_carlo_parallel
+
+    random.seed(seed)
+    deck = [Card.new(r + s) for r in _RANK_CHARS for s in "shdc"]
+    table = {}
+    for key in _classes():
+        suit2 = "s" if key.endswith("s") else "h"
+        hand = [Card.new(key[0] + "s"), Card.new(key[1] + suit2)]
+        table[key] = monte_carlo_parallel(hand, [], deck, sims, max_workers=1)
+    return table
+
+
+if __name__ == "__main__":
+    sims = int(sys.argv[1]) if len(sys.argv) > 1 else 120_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    table = _simulate_table(sims, seed)
+    # Same layout as PREFLOP_EQUITY above: one block per high rank
+    for hi in reversed(_RANK_CHARS):
+        entries = [f'"{k}": {v:.3f},' for k, v in table.items() if k[0] == hi]
+        for i in range(0, len(entries), 5):
+            print("    " + " ".join(entries[i:i + 5]))